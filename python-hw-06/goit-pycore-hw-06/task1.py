@@ -1,4 +1,17 @@
-from collections import UserDict
+import re
+import sys
+
+# Скомпільований шаблон номера: рівно 10 цифр
+_PHONE_RE = re.compile(r'\A\d{10}\Z').match
+
+def _intern(value):
+    """Інтернує рядок, щоб однакові збережені значення були одним об'єктом."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _validate_phone(phone_number):
+    """Перевіряє номер телефону і кидає ValueError, якщо він не з 10 цифр."""
+    if not (isinstance(phone_number, str) and _PHONE_RE(phone_number)):
+        raise ValueError("Неправильний формат телефону. Номер повинен складатися рівно з 10 цифр.")
 
 # --- Базові Класи ---
 
@@ -7,6 +20,8 @@ class Field:
     Базовий клас для всіх полів (наприклад, ім'я, телефон).
     Зберігає значення та надає стандартний строковий вигляд.
     """
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -19,48 +34,63 @@ class Name(Field):
     Успадковується від Field. Наразі не додає нової логіки,
     але є обов'язковим полем для Record.
     """
-    pass
+    __slots__ = ()
+
+    def __init__(self, value):
+        super().__init__(_intern(value))
 
 class Phone(Field):
     """
     Клас для зберігання номера телефону.
     Має вбудовану валідацію на 10 цифр при створенні.
     """
+    __slots__ = ()
+
     def __init__(self, value):
-        if not self.validate(value):
-            raise ValueError("Неправильний формат телефону. Номер повинен складатися рівно з 10 цифр.")
+        _validate_phone(value)
         super().__init__(value)
 
     @staticmethod
     def validate(phone_number):
         """Статичний метод для валідації номера."""
-        return isinstance(phone_number, str) and phone_number.isdigit() and len(phone_number) == 10
+        return isinstance(phone_number, str) and _PHONE_RE(phone_number) is not None
 
 # --- Клас Запису ---
 
 class Record:
     """
     Клас для зберігання інформації про один контакт.
-    Містить одне ім'я (Name) та список телефонів (list of Phone).
+    Містить одне ім'я (Name) та список номерів телефонів (list of str).
+    Номери зберігаються як рядки без обгортки Phone.
     """
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
+        # Індекс {номер: позиція у self.phones} для пошуку та заміни за O(1)
+        self._phone_index = {}
 
     def add_phone(self, phone_number):
         """
         Додає новий телефон до контакту.
-        Валідація відбувається при створенні об'єкта Phone.
+        Номер проходить валідацію перед додаванням.
         """
-        phone = Phone(phone_number)
-        self.phones.append(phone)
+        _validate_phone(phone_number)
+        if phone_number in self._phone_index:
+            print(f"Телефон {phone_number} вже є у контакту {self.name.value}")
+            return
+        phone_number = sys.intern(phone_number)
+        self._phone_index[phone_number] = len(self.phones)
+        self.phones.append(phone_number)
         print(f"Додано телефон: {phone_number} для контакту {self.name.value}")
 
     def remove_phone(self, phone_number):
         """Видаляє телефон зі списку за його значенням."""
-        phone_to_remove = self.find_phone(phone_number)
-        if phone_to_remove:
-            self.phones.remove(phone_to_remove)
+        index = self._phone_index.pop(phone_number, None)
+        if index is not None:
+            del self.phones[index]
+            # Зсуваємо позиції номерів, що стояли після видаленого
+            for i in range(index, len(self.phones)):
+                self._phone_index[self.phones[i]] = i
             print(f"Видалено телефон: {phone_number} у контакту {self.name.value}")
         else:
             print(f"Телефон {phone_number} не знайдено у контакту {self.name.value}")
@@ -71,15 +101,18 @@ class Record:
         Знаходить старий номер і замінює його новим.
         Новий номер проходить валідацію.
         """
-        # Валідація нового номера відбудеться при створенні об'єкта Phone
         try:
-            new_phone = Phone(new_phone_number)
-            phone_to_edit = self.find_phone(old_phone_number)
+            _validate_phone(new_phone_number)
+            new_phone_number = sys.intern(new_phone_number)
+            if new_phone_number != old_phone_number and new_phone_number in self._phone_index:
+                print(f"Телефон {new_phone_number} вже є у контакту {self.name.value}")
+                return
             
-            if phone_to_edit:
-                # Знаходимо індекс і замінюємо об'єкт
-                index = self.phones.index(phone_to_edit)
-                self.phones[index] = new_phone
+            index = self._phone_index.pop(old_phone_number, None)
+            if index is not None:
+                # Замінюємо номер на тій самій позиції
+                self.phones[index] = new_phone_number
+                self._phone_index[new_phone_number] = index
                 print(f"Телефон {old_phone_number} змінено на {new_phone_number} у контакту {self.name.value}")
             else:
                 print(f"Телефон {old_phone_number} не знайдено у контакту {self.name.value}")
@@ -88,39 +121,35 @@ class Record:
 
 
     def find_phone(self, phone_number):
-        """Шукає об'єкт Phone за його значенням (номером)."""
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        """Шукає номер телефону у контакті. Повертає номер або None."""
+        return phone_number if phone_number in self._phone_index else None
 
     def __str__(self):
         """Повертає строкове представлення запису."""
-        phone_list = '; '.join(p.value for p in self.phones)
+        phone_list = '; '.join(self.phones)
         return f"Contact name: {self.name.value}, phones: {phone_list if phone_list else 'No phones'}"
 
 # --- Клас Адресної Книги ---
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     """
     Клас для керування адресною книгою.
-    Успадковується від UserDict для зберігання записів (Record)
+    Успадковується від dict для зберігання записів (Record)
     у вигляді словника {ім'я: Запис}.
     """
     
     def add_record(self, record: Record):
         """Додає новий запис до адресної книги."""
-        self.data[record.name.value] = record
+        self[record.name.value] = record
         print(f"Додано контакт: {record.name.value}")
 
     def find(self, name):
         """Шукає запис за ім'ям."""
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name):
         """Видаляє запис за ім'ям."""
-        if name in self.data:
-            del self.data[name]
+        if self.pop(name, None) is not None:
             print(f"Контакт {name} видалено.")
         else:
             print(f"Контакт {name} не знайдено.")
@@ -156,7 +185,7 @@ if __name__ == "__main__":
     book.add_record(jane_record)
 
     print("--- Вміст адресної книги ---")
-    for name, record in book.data.items():
+    for name, record in book.items():
         print(record)
     print("----------------------------")
 
@@ -179,7 +208,7 @@ if __name__ == "__main__":
         # 12. Пошук конкретного телефону
         found_phone = john.find_phone("5555555555")
         if found_phone:
-            print(f"Знайдено телефон у John: {found_phone.value}")
+            print(f"Знайдено телефон у John: {found_phone}")
 
         # 13. Видалення телефону
         john.remove_phone("1111111111")
@@ -194,6 +223,6 @@ if __name__ == "__main__":
         print("Контакт Jane успішно видалено.")
 
     print("--- Фінальний вміст адресної книги ---")
-    for name, record in book.data.items():
+    for name, record in book.items():
         print(record)
     print("-----------------------------------")
\ No newline at end of file
@@ -1,10 +1,31 @@
-from collections import UserDict
-from datetime import datetime, timedelta
+import calendar
+import re
+import sys
+from datetime import date, datetime, timedelta
+
+# Скомпільований шаблон номера: рівно 10 цифр
+_PHONE_RE = re.compile(r'\A\d{10}\Z').match
+
+def _intern(value):
+    """Інтернує рядок, щоб однакові збережені значення були одним об'єктом."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _validate_phone(phone_number):
+    """Перевіряє, що номер складається рівно з 10 цифр."""
+    if not (isinstance(phone_number, str) and _PHONE_RE(phone_number)):
+        raise ValueError("Invalid phone format. Must be 10 digits.")
+
+# Назви днів тижня за індексом weekday() (Понеділок=0, Неділя=6)
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+# День привітання: Субота та Неділя переносяться на Понеділок
+_CONGR = _WEEKDAYS[:5] + ('Monday', 'Monday')
 
 # --- РОБОТА З КЛАСАМИ ---
 
 class Field:
     """Базовий клас для всіх полів."""
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -13,23 +34,31 @@ class Field:
 
 class Name(Field):
     """Клас для зберігання імені. Обов'язкове поле."""
-    pass
+    __slots__ = ()
+
+    def __init__(self, value):
+        super().__init__(_intern(value))
 
 class Phone(Field):
     """Клас для зберігання номера телефону. Має валідацію на 10 цифр."""
+    __slots__ = ()
+
     def __init__(self, value):
-        if not (len(value) == 10 and value.isdigit()):
-            raise ValueError("Invalid phone format. Must be 10 digits.")
+        _validate_phone(value)
         super().__init__(value)
 
 class Birthday(Field):
     """Клас для зберігання дати народження. Валідація у форматі DD.MM.YYYY."""
+    __slots__ = ('month', 'day')
+
     def __init__(self, value):
         try:
             # Перетворюємо рядок на об'єкт datetime
             self.value = datetime.strptime(value, '%d.%m.%Y').date()
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        # Кешуємо місяць і день для швидкого пошуку найближчих ДН
+        self.month, self.day = self.value.month, self.value.day
     
     def __str__(self):
         # Повертаємо дату у вихідному форматі
@@ -39,144 +68,282 @@ class Birthday(Field):
 class Record:
     """
     Клас для зберігання інформації про контакт, 
-    включаючи ім'я, список телефонів та дату народження.
+    включаючи ім'я, список телефонів (рядків) та дату народження.
     """
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
+        # Індекс {номер: позиція у self.phones} для пошуку та заміни за O(1)
+        self._phone_index = {}
         self.birthday = None  # Необов'язкове поле
+        # Пари (адресна книга, ключ запису в ній); кожна книга
+        # оновлює свій індекс днів народження
+        self._books = []
 
     def add_phone(self, phone_number):
         """Додає телефон до контакту."""
-        self.phones.append(Phone(phone_number))
+        _validate_phone(phone_number)
+        if phone_number in self._phone_index:
+            raise ValueError("Phone already exists.")
+        phone_number = sys.intern(phone_number)
+        self._phone_index[phone_number] = len(self.phones)
+        self.phones.append(phone_number)
 
     def remove_phone(self, phone_number):
         """Видаляє телефон з контакту."""
-        phone_obj = self.find_phone(phone_number)
-        if phone_obj:
-            self.phones.remove(phone_obj)
-        else:
+        index = self._phone_index.pop(phone_number, None)
+        if index is None:
             raise ValueError("Phone not found.")
+        del self.phones[index]
+        # Зсуваємо позиції номерів, що стояли після видаленого
+        for i in range(index, len(self.phones)):
+            self._phone_index[self.phones[i]] = i
 
     def edit_phone(self, old_number, new_number):
         """Замінює старий номер телефону на новий."""
-        phone_obj = self.find_phone(old_number)
-        if not phone_obj:
+        if not self.find_phone(old_number):
             raise ValueError("Old phone number not found.")
+        _validate_phone(new_number)
+        if new_number != old_number and new_number in self._phone_index:
+            raise ValueError("New phone number already exists.")
+        new_number = sys.intern(new_number)
         
-        # Валідація нового номера відбувається в __init__ класу Phone
-        new_phone_obj = Phone(new_number)
-        
-        # Знаходимо індекс старого номера і замінюємо
-        for i, phone in enumerate(self.phones):
-            if phone.value == old_number:
-                self.phones[i] = new_phone_obj
-                return
-            
+        # Замінюємо номер на позиції старого
+        index = self._phone_index.pop(old_number)
+        self.phones[index] = new_number
+        self._phone_index[new_number] = index
+
     def find_phone(self, phone_number):
-        """Пошук телефону у контакті."""
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        """Пошук телефону у контакті. Повертає номер або None."""
+        return phone_number if phone_number in self._phone_index else None
 
     def add_birthday(self, birthday):
-        """Додає або оновлює дату народження."""
+        """Додає або оновлює дату народження і повідомляє про це книгу."""
+        old_birthday = self.birthday
         self.birthday = Birthday(birthday)
+        for book, key in self._books:
+            book._birthday_changed(key, old_birthday, self.birthday)
+
+    def __getstate__(self):
+        # Зв'язки з книгами не зберігаємо: книга відновить їх при завантаженні
+        state = self.__dict__.copy()
+        state['_books'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_books', [])
 
     def __str__(self):
         """Повертає рядкове представлення запису."""
-        phones_str = '; '.join(p.value for p in self.phones)
+        phones_str = '; '.join(self.phones)
         birthday_str = f", birthday: {self.birthday}" if self.birthday else ""
         return f"Contact name: {self.name.value}, phones: {phones_str}{birthday_str}"
 
-class AddressBook(UserDict):
-    """Клас для зберігання та управління записами."""
+class AddressBook(dict):
+    """
+    Клас для зберігання та управління записами.
+    Усі зміни словника йдуть через __setitem__/__delitem__,
+    щоб індекс днів народження лишався актуальним.
+    """
+    def __init__(self, *args, **kwargs):
+        # Індекс днів народження {(місяць, день): [імена]}
+        self._by_day = {}
+        # Кеш результату get_upcoming_birthdays на поточний день
+        self._bday_cache = None
+        self._bday_cache_day = None
+        self._bday_dirty = True
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name, record):
+        if name in self:
+            self._detach(name, self[name])
+        super().__setitem__(name, record)
+        if not isinstance(record, Record):
+            return
+        record._books.append((self, name))
+        if record.birthday:
+            self._index_birthday(name, record.birthday)
+        self._bday_dirty = True
+
+    def __delitem__(self, name):
+        record = self[name]
+        self._detach(name, record)
+        super().__delitem__(name)
+
+    def __reduce__(self):
+        # Відновлюємо книгу через конструктор, щоб індекс зібрався заново
+        return (type(self), (dict(self),))
+
+    def copy(self):
+        """Повертає поверхневу копію книги з власним індексом."""
+        return type(self)(self)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        """Додає записи як dict.update, але через __setitem__."""
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def setdefault(self, name, default=None):
+        """Як dict.setdefault, але через __setitem__."""
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name, *default):
+        """Як dict.pop, але через __delitem__."""
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        record = self[name]
+        del self[name]
+        return record
+
+    def popitem(self):
+        """Як dict.popitem, але через __delitem__."""
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        name = next(reversed(self))
+        return name, self.pop(name)
+
+    def clear(self):
+        """Очищає книгу разом з індексом днів народження."""
+        for name, record in list(self.items()):
+            self._detach(name, record)
+        super().clear()
+        self._by_day.clear()
+        self._bday_dirty = True
+
+    def _detach(self, name, record):
+        """Відв'язує запис від книги та видаляє його з індексу."""
+        self._bday_dirty = True
+        if not isinstance(record, Record):
+            return
+        # Прибираємо лише зв'язок з цією книгою під цим ключем
+        record._books = [(book, key) for book, key in record._books
+                         if not (book is self and key == name)]
+        if record.birthday:
+            self._unindex_birthday(name, record.birthday)
+        self._bday_dirty = True
+
+    def _index_birthday(self, name, birthday):
+        """Додає ім'я до індексу днів народження."""
+        key = (birthday.month, birthday.day)
+        if key not in self._by_day:
+            self._by_day[key] = []
+        self._by_day[key].append(name)
+
+    def _unindex_birthday(self, name, birthday):
+        """Видаляє ім'я з індексу днів народження."""
+        key = (birthday.month, birthday.day)
+        names = self._by_day.get(key)
+        if names and name in names:
+            names.remove(name)
+            if not names:
+                del self._by_day[key]
+
+    def _birthday_changed(self, name, old_birthday, new_birthday):
+        """Оновлює індекс, коли у записі книги змінюється дата народження."""
+        if old_birthday:
+            self._unindex_birthday(name, old_birthday)
+        if new_birthday:
+            self._index_birthday(name, new_birthday)
+        self._bday_dirty = True
+
     def add_record(self, record: Record):
         """Додає запис до адресної книги."""
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    def set_birthday(self, name, birthday):
+        """Додає або оновлює дату народження контакту за ім'ям."""
+        # Запис сам повідомить книгу через _birthday_changed
+        self[name].add_birthday(birthday)
 
     def find(self, name):
         """Знаходить запис за ім'ям."""
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name):
         """Видаляє запис за ім'ям."""
-        if name in self.data:
-            del self.data[name]
-        else:
+        if name not in self:
             raise KeyError("Contact not found.")
+        del self[name]
 
     def get_upcoming_birthdays(self):
         """
         Повертає список користувачів, яких потрібно привітати 
         протягом наступних 7 днів, згрупованих по днях.
         """
+        today = date.today()
+        if self._bday_dirty or self._bday_cache_day != today:
+            self._bday_cache = self._collect_upcoming_birthdays(today)
+            self._bday_cache_day = today
+            self._bday_dirty = False
+
+        # Повертаємо копію, щоб зміни у результаті не зіпсували кеш
+        return {day: list(names) for day, names in self._bday_cache.items()}
+
+    def _collect_upcoming_birthdays(self, today):
+        """Збирає імена з індексу на 7 днів, починаючи з today."""
         users_to_greet = {}
-        today = datetime.today().date()
+        today_ord = today.toordinal()
+
+        # Переглядаємо лише 7 днів індексу замість усіх записів
+        for offset in range(7):
+            day = date.fromordinal(today_ord + offset)
+            names = self._by_day.get((day.month, day.day), [])
+
+            if day.month == 3 and day.day == 1 and not calendar.isleap(day.year):
+                # У невисокосний рік ДН 29 лютого святкуємо 1 березня
+                names = self._by_day.get((2, 29), []) + names
+
+            if names:
+                # Визначаємо день привітання (вихідні переносяться на Понеділок)
+                congr_day_str = _CONGR[day.weekday()]
 
-        for record in self.data.values():
-            if not record.birthday:
-                continue
-            
-            bday = record.birthday.value
-            # Розраховуємо дату дня народження цього року
-            bday_this_year = bday.replace(year=today.year)
-
-            if bday_this_year < today:
-                # Якщо ДН вже пройшов, дивимось наступний рік
-                bday_this_year = bday.replace(year=today.year + 1)
-
-            # Перевіряємо, чи ДН потрапляє у 7-денний інтервал
-            delta_days = (bday_this_year - today).days
-
-            if 0 <= delta_days < 7:
-                day_of_week = bday_this_year.weekday() # Понеділок=0, Неділя=6
-                
-                # Визначаємо день привітання
-                congr_day_str = bday_this_year.strftime('%A')
-                
-                # Якщо Субота (5) або Неділя (6), переносимо на Понеділок
-                if day_of_week == 5 or day_of_week == 6:
-                    congr_day_str = "Monday"
-                    
                 if congr_day_str not in users_to_greet:
                     users_to_greet[congr_day_str] = []
-                users_to_greet[congr_day_str].append(record.name.value)
-        
+                users_to_greet[congr_day_str].extend(names)
+
         return users_to_greet
 
 # --- ДЕКОРАТОР ТА ОБРОБНИКИ КОМАНД ---
 
 def input_error(func):
     """
-    Декоратор для обробки помилок вводу користувача.
+    Декоратор для обробки помилок валідації (Phone, Birthday).
+    Очікувані ситуації (контакт не знайдено, бракує аргументів)
+    обробники повертають як звичайні повідомлення.
     """
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except ValueError as e:
-            return str(e)  # Для помилок валідації Phone, Birthday
-        except KeyError:
-            return "Contact not found."
-        except IndexError:
-            return "Invalid command format. Please provide necessary arguments."
-        except AttributeError:
-            return "Contact has no birthday saved."
-        except Exception as e:
-            return f"An unexpected error occurred: {e}"
+            return str(e)
     return inner
 
 def parse_input(user_input):
     """Розбиває ввід користувача на команду та аргументи."""
-    cmd, *args = user_input.split()
-    return cmd.lower(), *args
+    # Зайві аргументи відхиляють перевірки len(args) в обробниках
+    parts = user_input.split()
+    cmd = parts[0].lower() if parts else ''
+    return cmd, parts[1:]
+
+def hello(args, book: AddressBook):
+    """Вітається з користувачем."""
+    return "How can I help you?"
 
 @input_error
 def add_contact(args, book: AddressBook):
     """Додає контакт або новий телефон до існуючого контакту."""
-    if len(args) < 2:
-        raise IndexError("Invalid format. Usage: add [name] [phone]")
+    if len(args) != 2:
+        return "Invalid format. Usage: add [name] [phone]"
         
     name, phone = args
     record = book.find(name)
@@ -193,13 +360,13 @@ def add_contact(args, book: AddressBook):
 @input_error
 def change_contact(args, book: AddressBook):
     """Змінює номер телефону для існуючого контакту."""
-    if len(args) < 3:
-        raise IndexError("Invalid format. Usage: change [name] [old_phone] [new_phone]")
+    if len(args) != 3:
+        return "Invalid format. Usage: change [name] [old_phone] [new_phone]"
         
     name, old_phone, new_phone = args
     record = book.find(name)
     if record is None:
-        raise KeyError # "Contact not found."
+        return "Contact not found."
     
     # Помилки (не знайдено старий, невалідний новий) обробляться всередині
     record.edit_phone(old_phone, new_phone)
@@ -208,55 +375,55 @@ def change_contact(args, book: AddressBook):
 @input_error
 def show_phone(args, book: AddressBook):
     """Показує телефони вказаного контакту."""
-    if len(args) < 1:
-        raise IndexError("Invalid format. Usage: phone [name]")
+    if len(args) != 1:
+        return "Invalid format. Usage: phone [name]"
         
     name = args[0]
     record = book.find(name)
     if record is None:
-        raise KeyError # "Contact not found."
+        return "Contact not found."
     
     if not record.phones:
         return "Contact has no phones saved."
         
-    return f"{name}'s phones: {'; '.join(p.value for p in record.phones)}"
+    return f"{name}'s phones: {'; '.join(record.phones)}"
 
-def show_all(book: AddressBook):
+def show_all(args, book: AddressBook):
     """Показує всі контакти в адресній книзі."""
-    if not book.data:
+    if not book:
         return "Address book is empty."
     
     # Використовуємо __str__ з Record для гарного форматування
-    return "\n".join(str(record) for record in book.data.values())
+    return "\n".join(str(record) for record in book.values())
 
 @input_error
 def add_birthday(args, book: AddressBook):
     """Додає день народження до контакту."""
-    if len(args) < 2:
-        raise IndexError("Invalid format. Usage: add-birthday [name] [DD.MM.YYYY]")
+    if len(args) != 2:
+        return "Invalid format. Usage: add-birthday [name] [DD.MM.YYYY]"
             
     name, bday_str = args
     record = book.find(name)
     if record is None:
-        raise KeyError # "Contact not found."
+        return "Contact not found."
     
     # Валідація формату дати відбувається в record.add_birthday
-    record.add_birthday(bday_str)
+    book.set_birthday(name, bday_str)
     return "Birthday added."
 
 @input_error
 def show_birthday(args, book: AddressBook):
     """Показує день народження контакту."""
-    if len(args) < 1:
-        raise IndexError("Invalid format. Usage: show-birthday [name]")
+    if len(args) != 1:
+        return "Invalid format. Usage: show-birthday [name]"
         
     name = args[0]
     record = book.find(name)
     if record is None:
-        raise KeyError # "Contact not found."
+        return "Contact not found."
             
     if not record.birthday:
-        raise AttributeError # "Contact has no birthday saved."
+        return "Contact has no birthday saved."
             
     # Використовуємо __str__ з Birthday для форматування
     return f"{name}'s birthday: {record.birthday}"
@@ -287,6 +454,20 @@ def birthdays(args, book: AddressBook):
     return "\n".join(result_lines)
 
 
+# Таблиця команд: {команда: обробник(args, book)}; None означає вихід
+COMMANDS = {
+    "close": None,
+    "exit": None,
+    "hello": hello,
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
 # --- ГОЛОВНА ФУНКЦІЯ ---
 
 def main():
@@ -294,38 +475,22 @@ def main():
     print("Welcome to the assistant bot!")
     while True:
         user_input = input("Enter a command: ")
-        command, *args = parse_input(user_input)
+        command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command not in COMMANDS:
+            print("Invalid command.")
+            continue
+
+        handler = COMMANDS[command]
+        if handler is None:
             print("Good bye!")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-
-        elif command == "add":
-            print(add_contact(args, book))
-
-        elif command == "change":
-            print(change_contact(args, book))
-
-        elif command == "phone":
-            print(show_phone(args, book))
-
-        elif command == "all":
-            print(show_all(book))
-
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(birthdays(args, book))
-
-        else:
-            print("Invalid command.")
+        try:
+            print(handler(args, book))
+        except Exception as e:
+            # Остання лінія захисту: непередбачена помилка не зупиняє бота
+            print(f"An unexpected error occurred: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file